@@ -16,34 +16,1021 @@ from ultralytics import YOLO
 import math
 import time
 import sys
+import random
+import queue
+import threading
+from concurrent.futures import Future
+from msgpackrpc.error import TimeoutError as RPCTimeoutError, TransportError
+
+
+# Camera rig of the default AirSim multirotor. Extrinsics are relative to the
+# drone body frame (NED: x forward, y right, z down); offsets in meters,
+# angles and horizontal field of view in degrees. Adjust to match settings.json.
+CAMERA_CONFIGS = {
+    "front_center": {"position": (0.25, 0.0, 0.0), "pitch": 0.0, "roll": 0.0, "yaw": 0.0, "fov": 90.0},
+    "front_right": {"position": (0.25, 0.25, 0.0), "pitch": 0.0, "roll": 0.0, "yaw": 45.0, "fov": 90.0},
+    "front_left": {"position": (0.25, -0.25, 0.0), "pitch": 0.0, "roll": 0.0, "yaw": -45.0, "fov": 90.0},
+    "bottom_center": {"position": (0.0, 0.0, 0.1), "pitch": -90.0, "roll": 0.0, "yaw": 0.0, "fov": 90.0},
+    "back_center": {"position": (-0.25, 0.0, 0.0), "pitch": 0.0, "roll": 0.0, "yaw": 180.0, "fov": 90.0},
+}
+
+# Cameras captured every search cycle (forward and downward)
+DEFAULT_SEARCH_CAMERAS = ("front_center", "bottom_center")
+
+# Horizontal field of view assumed for cameras missing from CAMERA_CONFIGS
+DEFAULT_CAMERA_FOV = 90.0
+
+# Ground points farther than this (horizontal meters from the camera) are
+# discarded; rays just below the horizon land far away and are unreliable
+MAX_GROUND_RANGE = 60.0
+
+
+def rotation_from_euler(pitch, roll, yaw):
+    """
+    Build a body rotation matrix from Euler angles (AirSim convention)
+    
+    Args:
+        pitch (float): Pitch in degrees (negative = nose down)
+        roll (float): Roll in degrees
+        yaw (float): Yaw in degrees
+        
+    Returns:
+        np.ndarray: 3x3 rotation matrix
+    """
+    p, r, y = np.radians([pitch, roll, yaw])
+    rot_x = np.array([[1, 0, 0],
+                      [0, math.cos(r), -math.sin(r)],
+                      [0, math.sin(r), math.cos(r)]])
+    rot_y = np.array([[math.cos(p), 0, math.sin(p)],
+                      [0, 1, 0],
+                      [-math.sin(p), 0, math.cos(p)]])
+    rot_z = np.array([[math.cos(y), -math.sin(y), 0],
+                      [math.sin(y), math.cos(y), 0],
+                      [0, 0, 1]])
+    return rot_z @ rot_y @ rot_x
+
+
+def rotation_from_quaternion(q):
+    """
+    Build a rotation matrix from an AirSim quaternion
+    
+    Args:
+        q: Quaternion with w_val, x_val, y_val, z_val attributes
+        
+    Returns:
+        np.ndarray: 3x3 rotation matrix
+    """
+    w, x, y, z = q.w_val, q.x_val, q.y_val, q.z_val
+    return np.array([
+        [1 - 2*(y*y + z*z), 2*(x*y - w*z), 2*(x*z + w*y)],
+        [2*(x*y + w*z), 1 - 2*(x*x + z*z), 2*(y*z - w*x)],
+        [2*(x*z - w*y), 2*(y*z + w*x), 1 - 2*(x*x + y*y)],
+    ])
+
+
+def _project_ray(u, v, width, height, fov, origin, rotation, ground_z, max_range):
+    """Intersect the ray through pixel (u, v) with the ground plane"""
+    focal = (width / 2.0) / math.tan(math.radians(fov) / 2.0)
+    
+    # Camera frame: x along optical axis, y right, z down
+    ray_cam = np.array([1.0, (u - width / 2.0) / focal, (v - height / 2.0) / focal])
+    ray_world = rotation @ ray_cam
+    
+    # Ray must point down (positive z in NED) to hit the ground
+    if ray_world[2] <= 1e-6:
+        return None
+    t = (ground_z - origin[2]) / ray_world[2]
+    if t <= 0:
+        return None
+    
+    point = origin + t * ray_world
+    if math.hypot(point[0] - origin[0], point[1] - origin[1]) > max_range:
+        return None
+    return (float(point[0]), float(point[1]), float(point[2]))
+
+
+def project_pixel_to_ground(u, v, width, height, camera_config, drone_position,
+                            drone_orientation, ground_z=0.0, max_range=MAX_GROUND_RANGE):
+    """
+    Project an image pixel onto the ground plane using the drone pose and
+    the camera extrinsics
+    
+    Args:
+        u, v (float): Pixel coordinates
+        width, height (int): Image size in pixels
+        camera_config (dict): Camera extrinsics and FOV (see CAMERA_CONFIGS)
+        drone_position: Drone position (x_val, y_val, z_val)
+        drone_orientation: Drone orientation quaternion
+        ground_z (float): Ground plane height in NED (0 = takeoff level)
+        max_range (float): Farthest accepted ground point in meters
+        
+    Returns:
+        tuple: (x, y, z) ground point, or None if the ray misses the ground
+    """
+    rot_mount = rotation_from_euler(camera_config["pitch"], camera_config["roll"],
+                                    camera_config["yaw"])
+    rot_body = rotation_from_quaternion(drone_orientation)
+    
+    origin = np.array([drone_position.x_val, drone_position.y_val, drone_position.z_val])
+    origin = origin + rot_body @ np.array(camera_config["position"])
+    return _project_ray(u, v, width, height, camera_config["fov"], origin,
+                        rot_body @ rot_mount, ground_z, max_range)
+
+
+def project_pixel_from_camera_pose(u, v, width, height, fov, camera_position,
+                                   camera_orientation, ground_z=0.0,
+                                   max_range=MAX_GROUND_RANGE):
+    """
+    Project an image pixel onto the ground plane using the camera's world pose
+    
+    Args:
+        u, v (float): Pixel coordinates
+        width, height (int): Image size in pixels
+        fov (float): Horizontal field of view in degrees
+        camera_position: Camera position at capture time (x_val, y_val, z_val)
+        camera_orientation: Camera orientation quaternion at capture time
+        ground_z (float): Ground plane height in NED (0 = takeoff level)
+        max_range (float): Farthest accepted ground point in meters
+        
+    Returns:
+        tuple: (x, y, z) ground point, or None if the ray misses the ground
+    """
+    origin = np.array([camera_position.x_val, camera_position.y_val, camera_position.z_val])
+    return _project_ray(u, v, width, height, fov, origin,
+                        rotation_from_quaternion(camera_orientation), ground_z, max_range)
+
+
+def has_camera_pose(response):
+    """Whether an ImageResponse carries a usable camera pose"""
+    q = getattr(response, 'camera_orientation', None)
+    if q is None or getattr(response, 'camera_position', None) is None:
+        return False
+    return q.w_val**2 + q.x_val**2 + q.y_val**2 + q.z_val**2 > 0.5
+
+
+def track_angle(kinematics):
+    """
+    Direction of travel relative to the drone's heading
+    
+    Args:
+        kinematics: Drone kinematics (linear_velocity, orientation)
+        
+    Returns:
+        float: Angle in radians (0 = flying nose first), 0 when hovering
+    """
+    vel = kinematics.linear_velocity
+    if math.hypot(vel.x_val, vel.y_val) < 1e-3:
+        return 0.0
+    q = kinematics.orientation
+    yaw = math.atan2(2 * (q.w_val * q.z_val + q.x_val * q.y_val),
+                     1 - 2 * (q.y_val**2 + q.z_val**2))
+    return math.atan2(vel.y_val, vel.x_val) - yaw
+
+
+def distance_3d(a, b):
+    """Euclidean distance between two (x, y, z) tuples"""
+    return math.sqrt((a[0] - b[0])**2 + (a[1] - b[1])**2 + (a[2] - b[2])**2)
+
+
+class ConfirmationRoutePlanner:
+    """
+    Remaining flight plan with confirmation visits for candidate detections
+    
+    Candidates are inserted into the remaining coverage route with cheapest
+    insertion followed by a local 2-opt pass around the insertion point, so a
+    re-plan touches only a few stops and runs inside the flight loop. The
+    route (including the return leg to base) is kept within the flight-time
+    budget by dropping the coverage stops that save the most time; a
+    candidate is rejected only if it cannot fit even without coverage.
+    """
+    
+    def __init__(self, coverage_waypoints, base_position, speed, flight_time_budget,
+                 confirm_altitude, hover_time=3.0, merge_radius=5.0, reserve=0.1,
+                 two_opt_window=6):
+        """
+        Args:
+            coverage_waypoints (list): Remaining coverage stops as (x, y, z) in NED
+            base_position (tuple): Return point (x, y, z) in NED
+            speed (float): Planning flight speed in m/s
+            flight_time_budget (float): Total flight time available in seconds
+            confirm_altitude (float): Altitude for confirmation visits (positive value)
+            hover_time (float): Time spent capturing at each stop in seconds
+            merge_radius (float): Candidates closer than this are merged (meters)
+            reserve (float): Fraction of the budget held back as safety margin
+            two_opt_window (int): Stops on each side of an insertion revisited by 2-opt
+        """
+        self.route = [{'kind': 'coverage', 'position': tuple(wp)} for wp in coverage_waypoints]
+        self.base_position = tuple(base_position)
+        self.speed = speed
+        self.confirm_altitude = confirm_altitude
+        self.hover_time = hover_time
+        self.merge_radius = merge_radius
+        self.two_opt_window = two_opt_window
+        self.deadline = time.time() + flight_time_budget * (1.0 - reserve)
+        self.candidates = []
+        self.dropped_coverage = 0
+    
+    def time_remaining(self):
+        """Seconds left in the budget"""
+        return self.deadline - time.time()
+    
+    def route_time(self, current_position, route=None):
+        """Time to fly the route from current_position and return to base"""
+        route = self.route if route is None else route
+        total = 0.0
+        prev = tuple(current_position)
+        for stop in route:
+            total += distance_3d(prev, stop['position']) / self.speed + self.hover_time
+            prev = stop['position']
+        return total + distance_3d(prev, self.base_position) / self.speed
+    
+    def pending_candidates(self):
+        """Candidates still waiting for a confirmation visit"""
+        return [c for c in self.candidates if c['status'] == 'pending']
+    
+    def pop_next(self):
+        """Remove and return the next stop, or None when the route is done"""
+        return self.route.pop(0) if self.route else None
+    
+    def _point(self, index, current_position):
+        """Position at route index, with current position and base as sentinels"""
+        if index < 0:
+            return current_position
+        if index >= len(self.route):
+            return self.base_position
+        return self.route[index]['position']
+    
+    def _insertion_cost(self, index, position, current_position):
+        prev = self._point(index - 1, current_position)
+        nxt = self._point(index, current_position)
+        return (distance_3d(prev, position) + distance_3d(position, nxt)
+                - distance_3d(prev, nxt))
+    
+    def _two_opt(self, center, current_position):
+        """Reverse route segments near center while that shortens the tour"""
+        lo = max(0, center - self.two_opt_window)
+        hi = min(len(self.route) - 1, center + self.two_opt_window)
+        improved = True
+        while improved:
+            improved = False
+            for i in range(lo, hi):
+                for j in range(i + 1, hi + 1):
+                    a = self._point(i - 1, current_position)
+                    b = self.route[i]['position']
+                    c = self.route[j]['position']
+                    d = self._point(j + 1, current_position)
+                    delta = (distance_3d(a, c) + distance_3d(b, d)
+                             - distance_3d(a, b) - distance_3d(c, d))
+                    if delta < -1e-6:
+                        self.route[i:j + 1] = reversed(self.route[i:j + 1])
+                        improved = True
+    
+    def trim_to_budget(self, current_position):
+        """
+        Drop coverage stops until the route fits the remaining budget
+        
+        Returns:
+            bool: True if the route fits the budget
+        """
+        current_position = tuple(current_position)
+        remaining = self.time_remaining()
+        while self.route_time(current_position) > remaining:
+            best_index, best_saving = None, 0.0
+            for i, stop in enumerate(self.route):
+                if stop['kind'] != 'coverage':
+                    continue
+                prev = self._point(i - 1, current_position)
+                nxt = self._point(i + 1, current_position)
+                saving = (distance_3d(prev, stop['position'])
+                          + distance_3d(stop['position'], nxt)
+                          - distance_3d(prev, nxt))
+                if best_index is None or saving > best_saving:
+                    best_index, best_saving = i, saving
+            if best_index is None:
+                return False
+            self.route.pop(best_index)
+            self.dropped_coverage += 1
+        return True
+    
+    def add_candidate(self, ground_position, current_position, source, record=None):
+        """
+        Register a candidate detection and plan a confirmation visit
+        
+        Args:
+            ground_position (tuple): Estimated victim position (x, y, z) in NED
+            current_position (tuple): Current drone position (x, y, z) in NED
+            source (str): 'visual' or 'audio'
+            record (dict): Entry in victims_found to update on confirmation
+            
+        Returns:
+            str: 'merged', 'inserted' or 'rejected'
+        """
+        current_position = tuple(current_position)
+        gx, gy = ground_position[0], ground_position[1]
+        
+        for candidate in self.pending_candidates():
+            cx, cy = candidate['ground_position'][:2]
+            if math.hypot(gx - cx, gy - cy) <= self.merge_radius:
+                candidate['sources'].add(source)
+                if record is not None:
+                    candidate['records'].append(record)
+                return 'merged'
+        
+        candidate = {
+            'ground_position': tuple(ground_position),
+            'sources': {source},
+            'records': [record] if record is not None else [],
+            'status': 'pending'
+        }
+        stop = {
+            'kind': 'confirmation',
+            'position': (gx, gy, -self.confirm_altitude),
+            'candidate': candidate
+        }
+        
+        # Keep the plan so a rejected candidate leaves coverage untouched
+        saved_route = list(self.route)
+        saved_dropped = self.dropped_coverage
+        
+        # Cheapest insertion, then local 2-opt around the new stop
+        best_index = min(range(len(self.route) + 1),
+                         key=lambda i: self._insertion_cost(i, stop['position'], current_position))
+        self.route.insert(best_index, stop)
+        self._two_opt(best_index, current_position)
+        
+        # Only give up coverage if the confirmation stops alone fit the budget
+        confirmations = [other for other in self.route if other['kind'] == 'confirmation']
+        fits = self.route_time(current_position, confirmations) <= self.time_remaining()
+        if not fits or not self.trim_to_budget(current_position):
+            self.route = saved_route
+            self.dropped_coverage = saved_dropped
+            candidate['status'] = 'rejected'
+            self.candidates.append(candidate)
+            return 'rejected'
+        
+        self.candidates.append(candidate)
+        return 'inserted'
+    
+    def resolve(self, candidate, confirmed):
+        """Mark a candidate as confirmed or not found after its visit"""
+        candidate['status'] = 'confirmed' if confirmed else 'not_found'
+        for record in candidate['records']:
+            record['confirmed'] = confirmed
+
+
+class CaptureRateController:
+    """
+    Frame interval controller for captures taken while flying
+    
+    The interval is chosen so consecutive downward frames overlap by
+    target_overlap along track at the current ground speed and altitude,
+    and is stretched when frame processing takes longer than the interval
+    (inference saturated). The along-track footprint depends on the
+    direction of travel relative to the image axes, since the drone does
+    not turn to face its direction of travel. Achieved overlap, coverage
+    gaps and captures skipped while imaging is unavailable are tracked for
+    the mission report.
+    """
+    
+    def __init__(self, fov=90.0, aspect=144 / 256, target_overlap=0.3,
+                 min_interval=0.2, max_interval=5.0, saturation_margin=1.2,
+                 smoothing=0.3, camera_yaw=0.0):
+        """
+        Args:
+            fov (float): Horizontal field of view of the downward camera in degrees
+            aspect (float): Image height / width
+            target_overlap (float): Desired along-track overlap (0.0-1.0)
+            min_interval (float): Shortest interval between captures in seconds
+            max_interval (float): Longest interval between captures in seconds
+            saturation_margin (float): Headroom kept over the processing time
+            smoothing (float): Weight of the newest sample in the latency average
+            camera_yaw (float): Mount yaw of the downward camera in degrees
+        """
+        self.fov = fov
+        self.camera_yaw = math.radians(camera_yaw)
+        self.aspect = aspect
+        self.target_overlap = target_overlap
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.saturation_margin = saturation_margin
+        self.smoothing = smoothing
+        
+        self.processing_time = 0.0
+        self.last_capture_time = None
+        self.last_capture = None
+        self.captures = 0
+        self.failed = 0
+        self.skipped = 0
+        self.skipped_length = 0.0
+        self.saturated = 0
+        self.overlaps = []
+        self.gaps = []
+        self._last_skip = None
+    
+    def set_image_size(self, width, height):
+        """Update the footprint aspect ratio from a captured frame"""
+        if width > 0 and height > 0:
+            self.aspect = height / width
+    
+    def footprint_length(self, altitude, track=0.0):
+        """
+        Along-track ground footprint in meters
+        
+        Args:
+            altitude (float): Height above ground in meters
+            track (float): Travel direction relative to the drone heading in
+                           radians (see track_angle)
+            
+        Returns:
+            float: Length of the footprint along the direction of travel
+        """
+        half_hfov = math.radians(self.fov) / 2.0
+        half_vfov = math.atan(math.tan(half_hfov) * self.aspect)
+        # Image height runs along the camera's forward axis, width across it
+        along_height = 2.0 * max(altitude, 0.0) * math.tan(half_vfov)
+        along_width = 2.0 * max(altitude, 0.0) * math.tan(half_hfov)
+        
+        angle = track - self.camera_yaw
+        cos_a, sin_a = abs(math.cos(angle)), abs(math.sin(angle))
+        lengths = []
+        if cos_a > 1e-6:
+            lengths.append(along_height / cos_a)
+        if sin_a > 1e-6:
+            lengths.append(along_width / sin_a)
+        return min(lengths)
+    
+    def interval(self, ground_speed, altitude, track=0.0):
+        """
+        Seconds between captures for the current flight state
+        
+        Args:
+            ground_speed (float): Horizontal speed in m/s
+            altitude (float): Height above ground in meters
+            track (float): Travel direction relative to the drone heading in radians
+            
+        Returns:
+            float: Capture interval in seconds
+        """
+        # Back off when processing can't keep up with the requested rate
+        return max(self._overlap_interval(ground_speed, altitude, track),
+                   self.processing_time * self.saturation_margin)
+    
+    def _overlap_interval(self, ground_speed, altitude, track=0.0):
+        """Interval that meets the target overlap, ignoring processing time"""
+        advance = self.footprint_length(altitude, track) * (1.0 - self.target_overlap)
+        if ground_speed > 1e-3:
+            interval = advance / ground_speed
+        else:
+            interval = self.max_interval
+        return min(max(interval, self.min_interval), self.max_interval)
+    
+    def should_capture(self, now, ground_speed, altitude, track=0.0):
+        """Whether a frame is due at time now"""
+        if self.last_capture_time is None:
+            return True
+        return now - self.last_capture_time >= self.interval(ground_speed, altitude, track)
+    
+    def record_capture(self, now, x, y, altitude, processing_time, ground_speed=0.0,
+                       track=0.0):
+        """
+        Record a processed frame and update overlap statistics
+        
+        Args:
+            now (float): Capture timestamp
+            x, y (float): Drone ground position in meters
+            altitude (float): Height above ground in meters
+            processing_time (float): Capture and inference time in seconds
+            ground_speed (float): Horizontal speed in m/s at capture
+            track (float): Travel direction relative to the drone heading in radians
+        """
+        if ground_speed > 1e-3:
+            wanted = self._overlap_interval(ground_speed, altitude, track)
+            if processing_time * self.saturation_margin > wanted:
+                self.saturated += 1
+        
+        if self.captures:
+            self.processing_time += self.smoothing * (processing_time - self.processing_time)
+        else:
+            self.processing_time = processing_time
+        
+        footprint = self.footprint_length(altitude, track)
+        if self._last_skip is not None:
+            # Close the stretch flown without imaging
+            self.skipped_length += math.hypot(x - self._last_skip[0], y - self._last_skip[1])
+            self._last_skip = None
+        if self.last_capture is not None:
+            px, py, prev_footprint = self.last_capture
+            travelled = math.hypot(x - px, y - py)
+            length = (footprint + prev_footprint) / 2.0
+            # Hovering frames add no along-track information
+            if travelled > 1e-3 and length > 0:
+                self.overlaps.append(1.0 - travelled / length)
+                if travelled > length:
+                    self.gaps.append(travelled - length)
+        
+        self.last_capture = (x, y, footprint)
+        self.last_capture_time = now
+        self.captures += 1
+    
+    def record_failure(self, now):
+        """Record a capture that produced no frame"""
+        self.last_capture_time = now
+        self.failed += 1
+    
+    def record_skipped(self, now, x, y):
+        """
+        Record a due capture that was skipped because imaging is unavailable
+        
+        The distance flown from the last frame through the skipped captures
+        to the next frame is reported as skipped_length.
+        
+        Args:
+            now (float): Time the capture was due
+            x, y (float): Drone ground position in meters
+        """
+        previous = self._last_skip
+        if previous is None and self.last_capture is not None:
+            previous = self.last_capture[:2]
+        if previous is not None:
+            self.skipped_length += math.hypot(x - previous[0], y - previous[1])
+        self._last_skip = (x, y)
+        self.last_capture_time = now
+        self.skipped += 1
+    
+    def report(self):
+        """
+        Summarize achieved capture coverage
+        
+        Returns:
+            dict: Frame count, overlap statistics, coverage gaps and skipped captures
+        """
+        return {
+            'frames': self.captures,
+            'failed_frames': self.failed,
+            'skipped_frames': self.skipped,
+            'skipped_length': self.skipped_length,
+            'target_overlap': self.target_overlap,
+            'mean_overlap': sum(self.overlaps) / len(self.overlaps) if self.overlaps else None,
+            'min_overlap': min(self.overlaps) if self.overlaps else None,
+            'gaps': len(self.gaps),
+            'gap_length': sum(self.gaps),
+            'saturated': self.saturated,
+            'processing_time': self.processing_time
+        }
+
+
+# Per-attempt timeouts in seconds for each RPC category. Flight control is
+# never short-circuited; imaging and sensing degrade behind circuit breakers.
+DEFAULT_RPC_TIMEOUTS = {
+    'control': 10.0,
+    'imaging': 5.0,
+    'sensing': 2.0,
+}
+
+# Overall time in seconds one call may take, including retries, backoff and
+# reconnects
+DEFAULT_RPC_DEADLINES = {
+    'control': 30.0,
+    'imaging': 8.0,
+    'sensing': 4.0,
+}
+
+
+class RPCUnavailableError(Exception):
+    """Raised when a simulator call fails after all retries"""
+
+
+class CircuitOpenError(RPCUnavailableError):
+    """Raised when a call is skipped because its circuit breaker is open"""
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for one category of simulator calls
+    
+    Opens after failure_threshold consecutive failed attempts and lets a
+    trial call through once reset_timeout has passed (half-open). A
+    successful trial closes it again, a failed one re-opens it.
+    """
+    
+    def __init__(self, name, failure_threshold=3, reset_timeout=15.0):
+        """
+        Args:
+            name (str): Category name used in log messages
+            failure_threshold (int): Consecutive failed attempts before opening
+            reset_timeout (float): Seconds before a trial call is allowed
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = 'closed'
+        self.failures = 0
+        self.opened_at = None
+    
+    def allow(self):
+        """Whether a call may be attempted now"""
+        if self.state == 'open':
+            if time.time() - self.opened_at < self.reset_timeout:
+                return False
+            self.state = 'half_open'
+        return True
+    
+    def record_success(self):
+        """Record an attempt that reached the simulator"""
+        if self.state != 'closed':
+            print(f"[INFO] '{self.name}' calls recovered, circuit closed")
+        self.state = 'closed'
+        self.failures = 0
+    
+    def record_failure(self):
+        """Record a failed attempt"""
+        self.failures += 1
+        if self.state == 'half_open' or self.failures >= self.failure_threshold:
+            if self.state != 'open':
+                print(f"[WARNING] '{self.name}' calls failing, circuit open for "
+                      f"{self.reset_timeout:.0f}s")
+            self.state = 'open'
+            self.opened_at = time.time()
+
+
+def _close_client(client):
+    """Best-effort close of an AirSim client's RPC connection"""
+    rpc_client = getattr(client, 'client', client)
+    close = getattr(rpc_client, 'close', None)
+    if close is None:
+        return
+    try:
+        close()
+    except Exception:
+        pass
+
+
+class _RPCWorker:
+    """Daemon thread that owns one simulator client and runs its calls in order"""
+    
+    def __init__(self):
+        self.tasks = queue.Queue()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+    
+    def _run(self):
+        while True:
+            item = self.tasks.get()
+            if item is None:
+                return
+            fn, future = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn())
+            except BaseException as e:
+                future.set_exception(e)
+    
+    def submit(self, fn):
+        """Queue fn and return a Future for its result"""
+        future = Future()
+        self.tasks.put((fn, future))
+        return future
+    
+    def stop(self):
+        """Let the thread exit once its current call returns"""
+        self.tasks.put(None)
+
+
+class _RPCChannel:
+    """Client and worker thread serving one category of calls"""
+    
+    def __init__(self, name, client_factory):
+        self.name = name
+        self.client_factory = client_factory
+        self.client = None
+        self.worker = None
+        self.reconnects = 0
+        self.failed_reconnects = 0
+        self.abandoned_workers = 0
+    
+    def connect(self, timeout):
+        """Create a client on a fresh worker, replacing the current one"""
+        worker = _RPCWorker()
+        future = worker.submit(self.client_factory)
+        try:
+            client = future.result(timeout)
+        except BaseException:
+            worker.stop()
+            if not future.done():
+                self.abandoned_workers += 1
+            raise
+        
+        self.drop()
+        self.client, self.worker = client, worker
+    
+    def drop(self, hung=False):
+        """
+        Retire the current client and worker
+        
+        Args:
+            hung (bool): The worker is stuck in a call and is left behind
+                         with its client
+        """
+        if self.worker is not None:
+            if hung:
+                self.abandoned_workers += 1
+            elif self.client is not None:
+                # Close the socket on the thread that owns the client
+                self.worker.submit(lambda client=self.client: _close_client(client))
+            self.worker.stop()
+        self.client = None
+        self.worker = None
+
+
+class ResilientRPC:
+    """
+    Simulator RPC wrapper with deadlines, retries, reconnect and circuit breaking
+    
+    Flight control and each breaker-protected category get their own client
+    and worker thread, so a hung imaging call can neither block control
+    calls nor trigger a reconnect of the control client. A call is bounded
+    by an overall deadline that covers all retries, backoff and reconnects.
+    Timeouts and transport errors retire the channel's client and the next
+    attempt reconnects it; errors raised by the simulator itself are passed
+    through unchanged since retrying them would not help.
+    """
+    
+    def __init__(self, client_factory, aux_client_factory=None, timeouts=None,
+                 deadlines=None, max_retries=2, backoff_base=0.2, backoff_cap=2.0,
+                 failure_threshold=3, reset_timeout=15.0, max_reconnects=10,
+                 breaker_categories=('imaging', 'sensing')):
+        """
+        Args:
+            client_factory (callable): Returns a connected client for flight control
+            aux_client_factory (callable): Returns a connected client for the
+                                           breaker-protected categories
+                                           (default: client_factory)
+            timeouts (dict): Per-attempt timeouts overriding DEFAULT_RPC_TIMEOUTS
+            deadlines (dict): Per-call deadlines overriding DEFAULT_RPC_DEADLINES
+            max_retries (int): Retries after the first attempt
+            backoff_base (float): Base backoff delay in seconds
+            backoff_cap (float): Maximum backoff delay in seconds
+            failure_threshold (int): Failed attempts before a circuit opens
+            reset_timeout (float): Seconds an open circuit waits before a trial call
+            max_reconnects (int): Reconnects in a row without a successful call
+                                  before an imaging or sensing channel stays
+                                  down; control always reconnects
+            breaker_categories (tuple): Categories with their own client and breaker
+        """
+        self.timeouts = dict(DEFAULT_RPC_TIMEOUTS, **(timeouts or {}))
+        self.deadlines = dict(DEFAULT_RPC_DEADLINES, **(deadlines or {}))
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.max_reconnects = max_reconnects
+        
+        self.channels = {'control': _RPCChannel('control', client_factory)}
+        for category in breaker_categories:
+            self.channels[category] = _RPCChannel(category,
+                                                  aux_client_factory or client_factory)
+        self.breakers = {
+            category: CircuitBreaker(category, failure_threshold, reset_timeout)
+            for category in breaker_categories
+        }
+        self.counters = {}
+    
+    @property
+    def client(self):
+        """Flight control client; owned by its worker thread, not for direct calls"""
+        return self.channels['control'].client
+    
+    def connect(self, timeout=None):
+        """Connect every channel"""
+        for channel in self.channels.values():
+            channel.connect(timeout or self.timeouts['control'])
+    
+    def _channel(self, category):
+        return self.channels.get(category, self.channels['control'])
+    
+    def _reconnect(self, channel, timeout):
+        """Reconnect one channel unless it keeps failing right after reconnects"""
+        # Flight control is never given up on; its calls are bounded by deadlines
+        if channel.name != 'control' and channel.failed_reconnects >= self.max_reconnects:
+            return
+        channel.reconnects += 1
+        channel.failed_reconnects += 1
+        print(f"[WARNING] Reconnecting '{channel.name}' client to AirSim...")
+        try:
+            channel.connect(min(timeout, self.timeouts['control']))
+            print(f"[SUCCESS] Reconnected '{channel.name}' client!")
+        except Exception as e:
+            print(f"[WARNING] Reconnect of '{channel.name}' client failed: {e!r}")
+    
+    @staticmethod
+    def _is_transient(error):
+        """Whether an error points at the link rather than the request"""
+        return isinstance(error, (RPCTimeoutError, TransportError, OSError, EOFError))
+    
+    def _counter(self, category):
+        if category not in self.counters:
+            self.counters[category] = {
+                'calls': 0, 'retries': 0, 'timeouts': 0,
+                'failures': 0, 'short_circuits': 0
+            }
+        return self.counters[category]
+    
+    def available(self, category):
+        """Whether calls in category are currently let through"""
+        breaker = self.breakers.get(category)
+        return breaker is None or breaker.allow()
+    
+    def _execute(self, fn, category, timeout, retries, deadline):
+        counter = self._counter(category)
+        breaker = self.breakers.get(category)
+        channel = self._channel(category)
+        if breaker is not None and not breaker.allow():
+            counter['short_circuits'] += 1
+            raise CircuitOpenError(f"'{category}' circuit open")
+        
+        counter['calls'] += 1
+        if timeout is None:
+            timeout = self.timeouts.get(category, self.timeouts['control'])
+        if retries is None:
+            retries = self.max_retries
+        if deadline is None:
+            deadline = max(self.deadlines.get(category, self.deadlines['control']), timeout)
+        end = time.time() + deadline
+        
+        last_error = None
+        for attempt in range(retries + 1):
+            if attempt:
+                # Full jitter keeps retries from lining up with the failure
+                delay = random.uniform(0, min(self.backoff_cap,
+                                              self.backoff_base * 2**attempt))
+                if time.time() + delay >= end:
+                    break
+                counter['retries'] += 1
+                time.sleep(delay)
+            
+            if channel.worker is None:
+                self._reconnect(channel, end - time.time())
+            remaining = end - time.time()
+            if remaining <= 0:
+                break
+            
+            if channel.worker is None:
+                last_error = last_error or RPCUnavailableError(f"'{channel.name}' not connected")
+            else:
+                client = channel.client
+                future = channel.worker.submit(lambda: fn(client))
+                try:
+                    result = future.result(min(timeout, remaining))
+                except Exception as e:
+                    last_error = e
+                    if not future.done():
+                        # The worker is stuck in the call; leave it behind
+                        counter['timeouts'] += 1
+                        channel.drop(hung=True)
+                    elif self._is_transient(e):
+                        channel.drop()
+                    else:
+                        # The simulator answered, so the link itself is healthy
+                        channel.failed_reconnects = 0
+                        if breaker is not None:
+                            breaker.record_success()
+                        raise
+                else:
+                    channel.failed_reconnects = 0
+                    if breaker is not None:
+                        breaker.record_success()
+                    return result
+            
+            if breaker is not None:
+                breaker.record_failure()
+                if breaker.state == 'open':
+                    break
+        
+        counter['failures'] += 1
+        raise RPCUnavailableError(f"'{category}' call failed within {deadline:.1f}s: "
+                                  f"{last_error!r}")
+    
+    def call(self, method, *args, category='control', timeout=None, retries=None,
+             deadline=None, **kwargs):
+        """
+        Call a client method with a deadline and retries
+        
+        Args:
+            method (str): Client method name, e.g. 'simGetImages'
+            category (str): 'control', 'imaging' or 'sensing'
+            timeout (float): Timeout per attempt (default: category timeout)
+            retries (int): Retries after the first attempt (default: max_retries)
+            deadline (float): Overall time for the call including retries
+                              (default: category deadline, at least timeout)
+            
+        Returns:
+            The method's return value
+        """
+        return self._execute(lambda client: getattr(client, method)(*args, **kwargs),
+                             category, timeout, retries, deadline)
+    
+    def call_and_join(self, method, *args, category='control', timeout=None,
+                      retries=None, deadline=None, **kwargs):
+        """
+        Call an *Async client method and wait for it to finish within the deadline
+        
+        Only use with idempotent commands (moves, takeoff, landing), since a
+        retry re-issues the whole command.
+        """
+        return self._execute(lambda client: getattr(client, method)(*args, **kwargs).join(),
+                             category, timeout, retries, deadline)
+    
+    def get_stats(self):
+        """
+        Retry, timeout, reconnect and circuit counters
+        
+        Returns:
+            dict: Per-category counters, per-channel reconnects and abandoned
+                  worker threads, and circuit states
+        """
+        return {
+            'categories': {name: dict(counter) for name, counter in self.counters.items()},
+            'channels': {
+                name: {'reconnects': channel.reconnects,
+                       'abandoned_workers': channel.abandoned_workers}
+                for name, channel in self.channels.items()
+            },
+            'reconnects': sum(channel.reconnects for channel in self.channels.values()),
+            'abandoned_workers': sum(channel.abandoned_workers
+                                     for channel in self.channels.values()),
+            'circuits': {name: breaker.state for name, breaker in self.breakers.items()}
+        }
+    
+    def close(self):
+        """Close the clients and stop the worker threads"""
+        for channel in self.channels.values():
+            channel.drop()
+
 
 class SearchAndRescueDrone:
     """Main class for autonomous search and rescue drone operations"""
     
-    def __init__(self, drone_name="Drone1"):
+    def __init__(self, drone_name="Drone1", cameras=DEFAULT_SEARCH_CAMERAS,
+                 rpc_timeouts=None, rpc_deadlines=None):
         """
         Initialize the drone and connect to AirSim simulator
         
         Args:
             drone_name (str): Name of the drone in the simulator
+            cameras (tuple): Camera names captured every search cycle
+            rpc_timeouts (dict): Per-attempt RPC timeouts (see DEFAULT_RPC_TIMEOUTS)
+            rpc_deadlines (dict): Per-call RPC deadlines (see DEFAULT_RPC_DEADLINES)
         """
         self.drone_name = drone_name
-        self.client = None
+        self.cameras = tuple(cameras)
+        self.rpc_timeouts = rpc_timeouts
+        self.rpc_deadlines = rpc_deadlines
+        self.rpc = None
         self.model = None
         self.start_position = None
         self.victims_found = []
+        self.route_planner = None
+        self.capture_controller = None
+        self.search_speed = 10
         
+    @property
+    def client(self):
+        """
+        Flight control AirSim client, for inspection only
+        
+        The client belongs to the RPC worker thread and is replaced on
+        reconnect. Calling it directly bypasses deadlines and retries and
+        is not thread-safe; use self.rpc.call() / call_and_join() instead.
+        """
+        return self.rpc.client if self.rpc is not None else None
+    
+    @staticmethod
+    def _create_client():
+        """Create a connected AirSim client with API control enabled"""
+        client = airsim.MultirotorClient()
+        client.confirmConnection()
+        client.enableApiControl(True)
+        return client
+    
+    @staticmethod
+    def _create_sensor_client():
+        """Create a connected AirSim client for imaging and sensing calls"""
+        client = airsim.MultirotorClient()
+        client.confirmConnection()
+        return client
+    
     def connect(self):
         """Connect to AirSim simulator"""
         print("[INFO] Connecting to AirSim simulator...")
         try:
-            self.client = airsim.MultirotorClient()
-            self.client.confirmConnection()
+            self.rpc = ResilientRPC(self._create_client, self._create_sensor_client,
+                                    timeouts=self.rpc_timeouts,
+                                    deadlines=self.rpc_deadlines)
+            self.rpc.connect()
             print("[SUCCESS] Connected to AirSim!")
             
-            # Enable API control and arm the drone
-            self.client.enableApiControl(True)
-            self.client.armDisarm(True)
+            # Arm the drone (API control is enabled on every (re)connect)
+            self.rpc.call('armDisarm', True)
             print("[SUCCESS] Drone armed and ready!")
         except Exception as e:
             print(f"[ERROR] Failed to connect: {e}")
@@ -69,13 +1056,14 @@ class SearchAndRescueDrone:
         """
         print(f"[MISSION] Taking off to altitude {altitude}m...")
         try:
-            self.client.takeoffAsync().join()
+            self.rpc.call_and_join('takeoffAsync', timeout=30.0)
             
             # Move to hover position
-            self.client.moveToPositionAsync(0, 0, -altitude, 5).join()
+            self.rpc.call_and_join('moveToPositionAsync', 0, 0, -altitude, 5,
+                                   timeout=altitude / 5 * 1.5 + 10.0)
             
             # Store starting position
-            state = self.client.getMultirotorState()
+            state = self.rpc.call('getMultirotorState')
             self.start_position = state.kinematics_estimated.position
             print(f"[SUCCESS] Takeoff complete. Current position: "
                   f"({self.start_position.x_val:.2f}, "
@@ -87,7 +1075,7 @@ class SearchAndRescueDrone:
     
     def get_drone_position(self):
         """Get current drone position"""
-        state = self.client.getMultirotorState()
+        state = self.rpc.call('getMultirotorState')
         pos = state.kinematics_estimated.position
         return pos
     
@@ -105,7 +1093,7 @@ class SearchAndRescueDrone:
         """
         try:
             # Query victim position from Unreal Engine
-            victim_pose = self.client.simGetObjectPose(victim_name)
+            victim_pose = self.rpc.call('simGetObjectPose', victim_name, category='sensing')
             
             # Calculate Euclidean distance
             dx = victim_pose.position.x_val - drone_pos.x_val
@@ -120,6 +1108,23 @@ class SearchAndRescueDrone:
             # Victim actor may not exist yet
             return False, 0.0
     
+    def _parse_person_detections(self, result):
+        """Extract person detections from a single YOLO result"""
+        detections = []
+        for box in result.boxes:
+            cls_id = int(box.cls)
+            confidence = float(box.conf)
+            
+            # Check if detection is a person (class 0 in COCO dataset)
+            if cls_id == 0:  # Person class
+                bbox = box.xyxy[0].cpu().numpy()
+                detections.append({
+                    'bbox': bbox,
+                    'confidence': confidence,
+                    'class': 'person'
+                })
+        return detections
+    
     def detect_humans_in_image(self, image):
         """
         Detect humans in image using YOLOv8
@@ -138,24 +1143,33 @@ class SearchAndRescueDrone:
             detections = []
             
             for result in results:
-                for box in result.boxes:
-                    cls_id = int(box.cls)
-                    confidence = float(box.conf)
-                    
-                    # Check if detection is a person (class 0 in COCO dataset)
-                    if cls_id == 0:  # Person class
-                        bbox = box.xyxy[0].cpu().numpy()
-                        detections.append({
-                            'bbox': bbox,
-                            'confidence': confidence,
-                            'class': 'person'
-                        })
+                detections.extend(self._parse_person_detections(result))
             
             return detections
         except Exception as e:
             print(f"[WARNING] Error in detection: {e}")
             return []
     
+    def detect_humans_in_images(self, images):
+        """
+        Detect humans in several images with a single batched YOLOv8 pass
+        
+        Args:
+            images (list): OpenCV images
+            
+        Returns:
+            list: One list of detections per input image
+        """
+        if self.model is None or not images:
+            return [[] for _ in images]
+        
+        try:
+            results = self.model(list(images), verbose=False)
+            return [self._parse_person_detections(result) for result in results]
+        except Exception as e:
+            print(f"[WARNING] Error in batched detection: {e}")
+            return [[] for _ in images]
+    
     def capture_and_analyze_frame(self, camera_id=0):
         """
         Capture frame from drone camera and analyze for humans
@@ -168,8 +1182,10 @@ class SearchAndRescueDrone:
         """
         try:
             # Get image from drone camera
-            responses = self.client.simGetImages(
-                [airsim.ImageRequest(camera_id, airsim.ImageType.Scene, False, False)]
+            responses = self.rpc.call(
+                'simGetImages',
+                [airsim.ImageRequest(camera_id, airsim.ImageType.Scene, False, False)],
+                category='imaging'
             )
             
             if not responses or responses[0].image_data_uint8 is None:
@@ -191,83 +1207,469 @@ class SearchAndRescueDrone:
                 'detections': detections,
                 'timestamp': time.time()
             }
+        except CircuitOpenError:
+            return {'success': False, 'skipped': True, 'detections': []}
         except Exception as e:
             print(f"[WARNING] Frame capture error: {e}")
             return {'success': False, 'detections': []}
     
-    def search_mission(self, search_area_size=100, altitude=30, speed=10):
+    def capture_and_analyze_frames(self, camera_names=None, kinematics=None, ground_z=0.0,
+                                   max_range=MAX_GROUND_RANGE):
         """
-        Execute lawnmower search pattern
+        Capture all configured cameras in one request and analyze them together
+        
+        Detections are mapped to the ground with the camera pose reported in
+        each image response, i.e. the pose at capture time.
+        
+        Args:
+            camera_names (list): Cameras to capture (default: self.cameras)
+            kinematics: Drone kinematics used for ground mapping when a response
+                        has no camera pose (fetched from the simulator if needed)
+            ground_z (float): Ground plane height in NED
+            max_range (float): Farthest accepted ground point in meters
+            
+        Returns:
+            dict: Analysis results with per-camera frames and merged detections
+        """
+        names = list(camera_names or self.cameras)
+        try:
+            # One round-trip for every camera
+            responses = self.rpc.call(
+                'simGetImages',
+                [airsim.ImageRequest(name, airsim.ImageType.Scene, False, False)
+                 for name in names],
+                category='imaging'
+            )
+            
+            frames = []
+            for name, response in zip(names, responses or []):
+                if (response is None or not response.image_data_uint8
+                        or response.width == 0 or response.height == 0):
+                    print(f"[WARNING] No image from camera '{name}'")
+                    continue
+                img1d = np.frombuffer(response.image_data_uint8, dtype=np.uint8)
+                img_rgb = img1d.reshape(response.height, response.width, 3)
+                frames.append((name, img_rgb, response))
+            
+            if not frames:
+                return {'success': False, 'frames': {}, 'detections': []}
+            
+            # Single batched inference pass over all frames
+            batch_detections = self.detect_humans_in_images([img for _, img, _ in frames])
+            
+            results = {}
+            all_detections = []
+            for (name, img_rgb, response), detections in zip(frames, batch_detections):
+                height, width = img_rgb.shape[:2]
+                config = CAMERA_CONFIGS.get(name)
+                for det in detections:
+                    det['camera'] = name
+                    det['ground_position'] = None
+                    x1, y1, x2, y2 = det['bbox']
+                    # Feet of the person: bottom-center of the box
+                    u, v = (x1 + x2) / 2.0, y2
+                    if has_camera_pose(response):
+                        # The response pose is enough; only the FOV may be unknown
+                        fov = config["fov"] if config is not None else DEFAULT_CAMERA_FOV
+                        det['ground_position'] = project_pixel_from_camera_pose(
+                            u, v, width, height, fov, response.camera_position,
+                            response.camera_orientation, ground_z, max_range
+                        )
+                    elif config is not None:
+                        if kinematics is None:
+                            kinematics = self.rpc.call('getMultirotorState').kinematics_estimated
+                        det['ground_position'] = project_pixel_to_ground(
+                            u, v, width, height, config, kinematics.position,
+                            kinematics.orientation, ground_z, max_range
+                        )
+                all_detections.extend(detections)
+                results[name] = {
+                    'image': cv2.cvtColor(img_rgb, cv2.COLOR_RGB2BGR),
+                    'detections': detections
+                }
+            
+            return {
+                'success': True,
+                'frames': results,
+                'detections': all_detections,
+                'timestamp': time.time()
+            }
+        except CircuitOpenError:
+            # Imaging is degraded; flight control carries on without it
+            return {'success': False, 'skipped': True, 'frames': {}, 'detections': []}
+        except Exception as e:
+            print(f"[WARNING] Multi-camera capture error: {e}")
+            return {'success': False, 'frames': {}, 'detections': []}
+    
+    def _record_visual_detections(self, analysis, stop_number, position, where,
+                                  merge_radius):
+        """
+        Log visual detections and add new victims to victims_found
+        
+        A detection within merge_radius of an already recorded visual victim
+        is counted as another sighting of it instead of a new victim.
+        Detections that could not be mapped to the ground (unknown camera pose
+        or beyond mapping range) are recorded without a ground position, one
+        record per stop and camera, and get no confirmation visit.
+        
+        Args:
+            analysis (dict): Result of capture_and_analyze_frames()
+            stop_number (int): Stop index stored in new records
+            position (tuple): Drone position stored in new records
+            where (str): Location text for the log message
+            merge_radius (float): Sightings closer than this are the same victim
+            
+        Returns:
+            list: (ground_position, record, is_new) for detections mapped to the ground
+        """
+        visual_hits = []
+        if not (analysis['success'] and analysis['detections']):
+            return visual_hits
+        
+        new_records = []
+        unmapped = 0
+        for det in analysis['detections']:
+            ground_position = det['ground_position']
+            if ground_position is None:
+                unmapped += 1
+                existing = self._find_unmapped_record(stop_number, det['camera'])
+                if existing is not None:
+                    existing['sightings'] += 1
+                    existing['confidence'] = max(existing['confidence'], det['confidence'])
+                    continue
+                record = {
+                    'type': 'visual',
+                    'waypoint': stop_number,
+                    'position': position,
+                    'camera': det['camera'],
+                    'ground_position': None,
+                    'confidence': det['confidence'],
+                    'sightings': 1
+                }
+                self.victims_found.append(record)
+                new_records.append(record)
+                continue
+            
+            existing = self._find_visual_record(ground_position, merge_radius)
+            if existing is not None:
+                existing['sightings'] += 1
+                existing['confidence'] = max(existing['confidence'], det['confidence'])
+                visual_hits.append((ground_position, existing, False))
+                continue
+            
+            record = {
+                'type': 'visual',
+                'waypoint': stop_number,
+                'position': position,
+                'camera': det['camera'],
+                'ground_position': ground_position,
+                'confidence': det['confidence'],
+                'sightings': 1
+            }
+            self.victims_found.append(record)
+            new_records.append(record)
+            visual_hits.append((ground_position, record, True))
+        
+        if new_records:
+            print(f"[ALERT] 🚨 VISUAL DETECTION {where}!")
+            for record in new_records:
+                print(f"  └─ Person detected by {record['camera']} "
+                      f"(confidence: {record['confidence']:.2%})")
+        if unmapped:
+            print(f"[INFO] {unmapped} detection(s) {where} could not be mapped to the "
+                  f"ground, recorded without a confirmation visit")
+        return visual_hits
+    
+    def _find_visual_record(self, ground_position, merge_radius):
+        """Recorded visual victim within merge_radius of ground_position, if any"""
+        gx, gy = ground_position[0], ground_position[1]
+        for record in self.victims_found:
+            known = record.get('ground_position')
+            if record['type'] != 'visual' or known is None:
+                continue
+            if math.hypot(gx - known[0], gy - known[1]) <= merge_radius:
+                return record
+        return None
+    
+    def _find_unmapped_record(self, stop_number, camera):
+        """Unmapped visual record from the same stop and camera, if any"""
+        for record in self.victims_found:
+            if (record['type'] == 'visual' and record.get('ground_position') is None
+                    and record['waypoint'] == stop_number and record['camera'] == camera):
+                return record
+        return None
+    
+    def _timed_capture(self, kinematics, ground_z=0.0):
+        """Capture all cameras and feed the result to the capture controller"""
+        started = time.time()
+        analysis = self.capture_and_analyze_frames(kinematics=kinematics, ground_z=ground_z)
+        if analysis.get('skipped'):
+            # Imaging circuit is open; the stretch flown blind is reported
+            pos = kinematics.position
+            self.capture_controller.record_skipped(started, pos.x_val, pos.y_val)
+            return analysis
+        if not analysis['success']:
+            # Wait a full interval before retrying; the miss shows up as a gap
+            self.capture_controller.record_failure(started)
+            return analysis
+        pos = kinematics.position
+        vel = kinematics.linear_velocity
+        
+        footprint_camera = analysis['frames'].get('bottom_center')
+        if footprint_camera is not None:
+            height, width = footprint_camera['image'].shape[:2]
+            self.capture_controller.set_image_size(width, height)
+        self.capture_controller.record_capture(
+            started, pos.x_val, pos.y_val, ground_z - pos.z_val,
+            time.time() - started, math.hypot(vel.x_val, vel.y_val),
+            track_angle(kinematics)
+        )
+        return analysis
+    
+    def _fly_to_stop(self, x, y, z, speed, stop_number, planner,
+                     arrival_radius=1.0, poll_interval=0.05):
+        """
+        Fly to a stop, capturing frames on the way at the controller's rate
+        
+        Args:
+            x, y, z (float): Stop position in NED
+            speed (float): Flight speed
+            stop_number (int): Stop index used in detection records
+            planner (ConfirmationRoutePlanner): Receives in-transit candidates
+            arrival_radius (float): Distance at which the stop counts as reached
+            poll_interval (float): Seconds between state polls
+        """
+        pos = self.get_drone_position()
+        expected = distance_3d((pos.x_val, pos.y_val, pos.z_val), (x, y, z)) / max(speed, 0.1)
+        give_up = time.time() + 1.5 * expected + 5.0
+        
+        # Start the move without waiting so frames can be captured on the way
+        self.rpc.call('moveToPositionAsync', x, y, z, speed)
+        while time.time() < give_up:
+            kinematics = self.rpc.call('getMultirotorState').kinematics_estimated
+            pos = kinematics.position
+            current = (pos.x_val, pos.y_val, pos.z_val)
+            if distance_3d(current, (x, y, z)) <= arrival_radius:
+                break
+            
+            vel = kinematics.linear_velocity
+            ground_speed = math.hypot(vel.x_val, vel.y_val)
+            if not self.capture_controller.should_capture(time.time(), ground_speed,
+                                                          -pos.z_val, track_angle(kinematics)):
+                time.sleep(poll_interval)
+            elif not self.rpc.available('imaging'):
+                self.capture_controller.record_skipped(time.time(), pos.x_val, pos.y_val)
+                time.sleep(poll_interval)
+            else:
+                analysis = self._timed_capture(kinematics)
+                visual_hits = self._record_visual_detections(
+                    analysis, stop_number, (pos.x_val, pos.y_val, -pos.z_val),
+                    f"in transit to stop {stop_number}", planner.merge_radius
+                )
+                # The current stop is already off the route: plan from it
+                for ground_position, record, is_new in visual_hits:
+                    if is_new:
+                        outcome = planner.add_candidate(ground_position, (x, y, z),
+                                                        'visual', record)
+                        self._report_candidate(outcome, ground_position)
+        
+        # Re-issuing the same move is idempotent and survives a reconnect mid-leg
+        self.rpc.call_and_join('moveToPositionAsync', x, y, z, speed,
+                               timeout=max(give_up - time.time(), 0.0) + 10.0)
+    
+    def search_mission(self, search_area_size=100, altitude=30, speed=10,
+                       flight_time_budget=600, confirm_altitude=None, target_overlap=0.3):
+        """
+        Execute lawnmower search pattern with confirmation visits
+        
+        Candidate detections from vision or audio are inserted into the
+        remaining route and revisited at a lower altitude, as long as the
+        route and the return leg to base fit the flight-time budget.
         
         Args:
             search_area_size (float): Size of search area in meters
             altitude (float): Search altitude (positive value)
             speed (float): Flight speed
+            flight_time_budget (float): Flight time available in seconds,
+                                        including the return to base
+            confirm_altitude (float): Confirmation visit altitude (default: altitude/2)
+            target_overlap (float): Along-track overlap between frames captured in flight
         """
         print(f"\n[MISSION] Starting search pattern...")
         print(f"[INFO] Search area: {search_area_size}x{search_area_size}m, Altitude: {altitude}m")
         
+        if confirm_altitude is None:
+            confirm_altitude = altitude / 2
+        # The planner budgets the return leg at this speed
+        self.search_speed = speed
+        
         # Define lawnmower pattern waypoints
         waypoints = [
-            (0, 0, -altitude, speed),
-            (search_area_size, 0, -altitude, speed),
-            (search_area_size, search_area_size, -altitude, speed),
-            (0, search_area_size, -altitude, speed),
-            (search_area_size//2, search_area_size//2, -altitude, speed),  # Center
+            (0, 0, -altitude),
+            (search_area_size, 0, -altitude),
+            (search_area_size, search_area_size, -altitude),
+            (0, search_area_size, -altitude),
+            (search_area_size//2, search_area_size//2, -altitude),  # Center
         ]
         
-        for i, (x, y, z, spd) in enumerate(waypoints):
-            print(f"\n[NAVIGATION] Waypoint {i+1}/{len(waypoints)}: ({x}, {y}, {-z}m)")
+        if self.start_position:
+            base = (self.start_position.x_val, self.start_position.y_val,
+                    self.start_position.z_val)
+        else:
+            base = (0, 0, -altitude)
+        
+        planner = ConfirmationRoutePlanner(waypoints, base, speed, flight_time_budget,
+                                           confirm_altitude)
+        self.route_planner = planner
+        footprint_camera = CAMERA_CONFIGS.get("bottom_center", CAMERA_CONFIGS["front_center"])
+        self.capture_controller = CaptureRateController(fov=footprint_camera["fov"],
+                                                        target_overlap=target_overlap,
+                                                        camera_yaw=footprint_camera["yaw"])
+        stop_number = 0
+        
+        while True:
+            try:
+                pos = self.get_drone_position()
+                current = (pos.x_val, pos.y_val, pos.z_val)
+            except Exception as e:
+                print(f"[WARNING] Position error: {e}")
+                current = base
+            
+            if not planner.trim_to_budget(current):
+                print("[WARNING] Flight-time budget exhausted, ending search")
+                break
+            
+            stop = planner.pop_next()
+            if stop is None:
+                break
+            stop_number += 1
+            x, y, z = stop['position']
+            
+            if stop['kind'] == 'confirmation':
+                print(f"\n[NAVIGATION] Confirmation visit {stop_number}: "
+                      f"({x:.1f}, {y:.1f}, {-z:.1f}m)")
+            else:
+                print(f"\n[NAVIGATION] Waypoint {stop_number} "
+                      f"({len(planner.route)} stops left): ({x}, {y}, {-z}m)")
             
             try:
-                self.client.moveToPositionAsync(x, y, z, spd).join()
+                self._fly_to_stop(x, y, z, speed, stop_number, planner)
                 
-                # Analyze frame at waypoint
-                analysis = self.capture_and_analyze_frame()
+                # Drone pose is shared by ground mapping and the audio sensor
+                kinematics = self.rpc.call('getMultirotorState').kinematics_estimated
+                drone_pos = kinematics.position
+                current = (drone_pos.x_val, drone_pos.y_val, drone_pos.z_val)
                 
-                if analysis['success']:
-                    if analysis['detections']:
-                        print(f"[ALERT] 🚨 VISUAL DETECTION at Waypoint {i+1}!")
-                        for det in analysis['detections']:
-                            conf = det['confidence']
-                            print(f"  └─ Person detected (confidence: {conf:.2%})")
-                            self.victims_found.append({
-                                'type': 'visual',
-                                'waypoint': i+1,
-                                'position': (x, y, -z),
-                                'confidence': conf
-                            })
+                # Analyze all cameras at this stop
+                analysis = self._timed_capture(kinematics)
+                visual_hits = self._record_visual_detections(
+                    analysis, stop_number, (x, y, -z), f"at stop {stop_number}",
+                    planner.merge_radius
+                )
                 
                 # Check audio sensor
-                drone_pos = self.get_drone_position()
                 heard_scream, distance = self.check_audio_sensor(drone_pos)
-                
+                audio_record = None
                 if heard_scream:
                     print(f"[ALERT] 🔊 AUDIO DETECTION at distance {distance:.2f}m!")
-                    self.victims_found.append({
+                
+                candidate = None
+                if stop['kind'] == 'confirmation':
+                    candidate = stop['candidate']
+                    cx, cy = candidate['ground_position'][:2]
+                    confirm_radius = 2 * planner.merge_radius
+                    confirmed = any(
+                        math.hypot(gp[0] - cx, gp[1] - cy) <= confirm_radius
+                        for gp, _, _ in visual_hits
+                    ) or ('audio' in candidate['sources'] and heard_scream)
+                    # The hearing belongs to the candidate being confirmed
+                    if heard_scream:
+                        self._attach_hearing(candidate, distance)
+                    planner.resolve(candidate, confirmed)
+                    if confirmed:
+                        print("[SUCCESS] Candidate confirmed!")
+                    else:
+                        print("[INFO] Candidate not confirmed")
+                elif heard_scream:
+                    audio_record = {
                         'type': 'audio',
-                        'waypoint': i+1,
+                        'waypoint': stop_number,
                         'position': (x, y, -z),
                         'distance': distance
-                    })
-                    print("[MISSION] Switching to rescue mode...")
-                    break
+                    }
+                    self.victims_found.append(audio_record)
+                
+                # Queue confirmation visits for new candidates
+                for ground_position, record, is_new in visual_hits:
+                    if candidate is not None and math.hypot(
+                            ground_position[0] - cx, ground_position[1] - cy) <= confirm_radius:
+                        # Sightings of the candidate itself need no further visit
+                        continue
+                    if is_new:
+                        outcome = planner.add_candidate(ground_position, current,
+                                                        'visual', record)
+                        self._report_candidate(outcome, ground_position)
+                if audio_record is not None:
+                    # Audio gives range only: confirm from overhead at lower altitude
+                    ground_position = (current[0], current[1], 0.0)
+                    outcome = planner.add_candidate(ground_position, current, 'audio',
+                                                    audio_record)
+                    self._report_candidate(outcome, ground_position)
                     
             except Exception as e:
                 print(f"[WARNING] Navigation error: {e}")
                 continue
+        
+        if planner.dropped_coverage:
+            print(f"[WARNING] {planner.dropped_coverage} coverage waypoint(s) "
+                  f"dropped to stay within flight-time budget")
+        pending = planner.pending_candidates()
+        if pending:
+            print(f"[WARNING] {len(pending)} candidate(s) left unconfirmed")
+        coverage = self.capture_controller.report()
+        if coverage['gaps']:
+            print(f"[WARNING] {coverage['gaps']} along-track coverage gap(s), "
+                  f"{coverage['gap_length']:.1f}m total")
+        if coverage['skipped_frames']:
+            print(f"[WARNING] {coverage['skipped_frames']} capture(s) skipped with imaging "
+                  f"unavailable, {coverage['skipped_length']:.1f}m flown without frames")
+    
+    def _attach_hearing(self, candidate, distance):
+        """Record an audio hit at a confirmation visit on the candidate's own entry"""
+        for record in candidate['records']:
+            if record['type'] == 'audio':
+                record['distance'] = min(record['distance'], distance)
+                record['hearings'] = record.get('hearings', 1) + 1
+                return
+        if candidate['records']:
+            candidate['records'][0]['audio_distance'] = distance
+    
+    def _report_candidate(self, outcome, ground_position):
+        """Print the planner outcome for a new candidate"""
+        gx, gy = ground_position[0], ground_position[1]
+        if outcome == 'inserted':
+            print(f"[MISSION] Confirmation visit planned at ({gx:.1f}, {gy:.1f})")
+        elif outcome == 'rejected':
+            print(f"[WARNING] No budget to confirm candidate at ({gx:.1f}, {gy:.1f})")
     
-    def return_to_base(self):
-        """Return drone to starting position"""
+    def return_to_base(self, speed=None):
+        """
+        Return drone to starting position
+        
+        Args:
+            speed (float): Flight speed (default: the last search speed, which
+                           the search budget assumed for the return leg)
+        """
         print("\n[MISSION] Returning to base...")
+        speed = speed or self.search_speed
         try:
             if self.start_position:
-                self.client.moveToPositionAsync(
-                    self.start_position.x_val,
-                    self.start_position.y_val,
-                    self.start_position.z_val,
-                    10
-                ).join()
+                base = (self.start_position.x_val, self.start_position.y_val,
+                        self.start_position.z_val)
+                pos = self.get_drone_position()
+                distance = distance_3d((pos.x_val, pos.y_val, pos.z_val), base)
+                self.rpc.call_and_join('moveToPositionAsync', *base, speed,
+                                       timeout=distance / speed * 1.5 + 10.0)
             print("[SUCCESS] Returned to base!")
         except Exception as e:
             print(f"[WARNING] Return to base error: {e}")
@@ -276,7 +1678,7 @@ class SearchAndRescueDrone:
         """Land the drone"""
         print("[MISSION] Landing...")
         try:
-            self.client.landAsync().join()
+            self.rpc.call_and_join('landAsync', timeout=60.0)
             print("[SUCCESS] Landed successfully!")
         except Exception as e:
             print(f"[ERROR] Landing error: {e}")
@@ -284,8 +1686,8 @@ class SearchAndRescueDrone:
     def disarm(self):
         """Disarm the drone"""
         try:
-            self.client.armDisarm(False)
-            self.client.enableApiControl(False)
+            self.rpc.call('armDisarm', False)
+            self.rpc.call('enableApiControl', False)
             print("[INFO] Drone disarmed and API control disabled")
         except Exception as e:
             print(f"[WARNING] Disarm error: {e}")
@@ -302,13 +1704,54 @@ class SearchAndRescueDrone:
                 print(f"\n{i}. Detection Type: {victim['type'].upper()}")
                 print(f"   Waypoint: {victim['waypoint']}")
                 print(f"   Position: {victim['position']}")
+                if 'camera' in victim:
+                    print(f"   Camera: {victim['camera']}")
+                if victim.get('ground_position'):
+                    gx, gy, gz = victim['ground_position']
+                    print(f"   Ground Position: ({gx:.2f}, {gy:.2f}, {gz:.2f})")
+                if victim.get('sightings', 1) > 1:
+                    print(f"   Sightings: {victim['sightings']}")
+                if 'confirmed' in victim:
+                    print(f"   Confirmed: {'YES' if victim['confirmed'] else 'NO'}")
                 if 'confidence' in victim:
                     print(f"   Confidence: {victim['confidence']:.2%}")
                 if 'distance' in victim:
                     print(f"   Distance: {victim['distance']:.2f}m")
+                if victim.get('hearings', 1) > 1:
+                    print(f"   Hearings: {victim['hearings']}")
+                if 'audio_distance' in victim:
+                    print(f"   Audio Distance: {victim['audio_distance']:.2f}m")
         else:
             print("No victims detected during search mission")
         
+        if self.capture_controller is not None:
+            coverage = self.capture_controller.report()
+            print(f"\nFrames Analyzed: {coverage['frames']} "
+                  f"({coverage['failed_frames']} failed)")
+            if coverage['mean_overlap'] is not None:
+                print(f"Along-track Overlap: mean {coverage['mean_overlap']:.0%}, "
+                      f"min {coverage['min_overlap']:.0%} "
+                      f"(target {coverage['target_overlap']:.0%})")
+            print(f"Coverage Gaps: {coverage['gaps']} ({coverage['gap_length']:.1f}m)")
+            if coverage['skipped_frames']:
+                print(f"Skipped Captures: {coverage['skipped_frames']} "
+                      f"({coverage['skipped_length']:.1f}m without imaging)")
+            if coverage['saturated']:
+                print(f"Inference Saturated: {coverage['saturated']} frame(s), "
+                      f"{coverage['processing_time']:.2f}s per frame")
+        
+        if self.rpc is not None:
+            stats = self.rpc.get_stats()
+            print(f"\nRPC Reconnects: {stats['reconnects']} "
+                  f"({stats['abandoned_workers']} hung worker thread(s) abandoned)")
+            for category, counter in stats['categories'].items():
+                state = stats['circuits'].get(category)
+                print(f"RPC {category}: {counter['calls']} calls, "
+                      f"{counter['retries']} retries, {counter['timeouts']} timeouts, "
+                      f"{counter['failures']} failures, "
+                      f"{counter['short_circuits']} skipped"
+                      + (f" (circuit {state})" if state else ""))
+        
         print("="*60 + "\n")
     
     def run_full_mission(self):
@@ -351,6 +1794,10 @@ class SearchAndRescueDrone:
             print(f"\n[CRITICAL ERROR] {e}")
             self.land()
             self.disarm()
+        finally:
+            # Release the simulator connections and worker threads
+            if self.rpc is not None:
+                self.rpc.close()
 
 
 def main():
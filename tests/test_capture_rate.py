@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Unit tests for CaptureRateController
+Run with: python -m unittest discover tests
+"""
+
+import math
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from search_and_rescue import CaptureRateController
+
+
+class CaptureRateControllerTest(unittest.TestCase):
+    """Footprint, interval and overlap reporting"""
+    
+    def test_footprint_follows_travel_direction(self):
+        controller = CaptureRateController(fov=90.0, aspect=0.5)
+        
+        # Nose first: image height (narrow axis) is along track
+        self.assertAlmostEqual(controller.footprint_length(30, 0.0), 30.0)
+        # Sideways: image width is along track
+        self.assertAlmostEqual(controller.footprint_length(30, math.pi / 2), 60.0)
+        self.assertAlmostEqual(controller.footprint_length(30, -math.pi / 2), 60.0)
+    
+    def test_interval_meets_target_overlap(self):
+        controller = CaptureRateController(fov=90.0, aspect=0.5, target_overlap=0.5)
+        
+        # 30m footprint, 15m advance per frame at 5 m/s
+        self.assertAlmostEqual(controller.interval(5.0, 30), 3.0)
+        self.assertAlmostEqual(controller.interval(5.0, 30, math.pi / 2), 5.0)
+    
+    def test_interval_backs_off_when_saturated(self):
+        controller = CaptureRateController(fov=90.0, aspect=0.5, target_overlap=0.5)
+        controller.record_capture(0.0, 0, 0, 30, processing_time=4.0, ground_speed=10.0)
+        
+        self.assertEqual(controller.saturated, 1)
+        self.assertAlmostEqual(controller.interval(10.0, 30), 4.0 * controller.saturation_margin)
+    
+    def test_report_counts_gaps(self):
+        controller = CaptureRateController(fov=90.0, aspect=0.5)
+        controller.record_capture(0.0, 0, 0, 30, 0.1, 10.0)
+        controller.record_capture(1.0, 15, 0, 30, 0.1, 10.0)
+        controller.record_capture(2.0, 55, 0, 30, 0.1, 10.0)
+        
+        report = controller.report()
+        self.assertEqual(report['frames'], 3)
+        self.assertAlmostEqual(report['min_overlap'], 1.0 - 40 / 30)
+        self.assertEqual(report['gaps'], 1)
+        self.assertAlmostEqual(report['gap_length'], 10.0)
+
+    
+    def test_report_counts_skipped_captures(self):
+        controller = CaptureRateController(fov=90.0, aspect=0.5)
+        controller.record_capture(0.0, 0, 0, 30, 0.1, 10.0)
+        controller.record_skipped(1.0, 10, 0)
+        controller.record_skipped(2.0, 20, 0)
+        
+        report = controller.report()
+        self.assertEqual(report['skipped_frames'], 2)
+        self.assertAlmostEqual(report['skipped_length'], 20.0)
+        self.assertFalse(controller.should_capture(2.5, 10.0, 30))
+        
+        # The stretch ends at the next frame
+        controller.record_capture(3.0, 30, 0, 30, 0.1, 10.0)
+        self.assertAlmostEqual(controller.report()['skipped_length'], 30.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Unit tests for multi-camera capture and ground projection
+Run with: python -m unittest discover tests
+"""
+
+import math
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from search_and_rescue import (
+    CAMERA_CONFIGS,
+    ResilientRPC,
+    SearchAndRescueDrone,
+    project_pixel_from_camera_pose,
+    project_pixel_to_ground,
+)
+
+
+WIDTH, HEIGHT = 256, 144
+IDENTITY = SimpleNamespace(w_val=1.0, x_val=0.0, y_val=0.0, z_val=0.0)
+# Camera pitched 90 degrees down (AirSim bottom_center)
+LOOKING_DOWN = SimpleNamespace(w_val=math.cos(math.radians(-45)), x_val=0.0,
+                               y_val=math.sin(math.radians(-45)), z_val=0.0)
+# Downward cameras, by name and by legacy numeric id
+DOWNWARD = ('bottom_center', '3')
+
+
+def vector(x, y, z):
+    return SimpleNamespace(x_val=x, y_val=y, z_val=z)
+
+
+class FakeClient:
+    """Records image requests and returns one frame per camera"""
+    
+    def __init__(self):
+        self.image_calls = []
+    
+    def simGetImages(self, requests):
+        self.image_calls.append(requests)
+        return [
+            SimpleNamespace(
+                image_data_uint8=bytes(WIDTH * HEIGHT * 3), width=WIDTH, height=HEIGHT,
+                camera_position=vector(0.0, 0.0, -30.0),
+                camera_orientation=(LOOKING_DOWN if request.camera_name in DOWNWARD
+                                    else IDENTITY)
+            )
+            for request in requests
+        ]
+
+
+class FakeModel:
+    """Returns one centred person per image and records each call"""
+    
+    def __init__(self):
+        self.calls = []
+    
+    def __call__(self, images, verbose=False):
+        self.calls.append(images)
+        box = SimpleNamespace(
+            cls=0, conf=0.9,
+            xyxy=[SimpleNamespace(cpu=lambda: SimpleNamespace(
+                numpy=lambda: np.array([120.0, 62.0, 136.0, 72.0])))]
+        )
+        return [SimpleNamespace(boxes=[box]) for _ in images]
+
+
+class GroundProjectionTest(unittest.TestCase):
+    """Pixel to ground mapping"""
+    
+    def test_bottom_camera_centre_is_below_drone(self):
+        point = project_pixel_from_camera_pose(WIDTH / 2, HEIGHT / 2, WIDTH, HEIGHT, 90.0,
+                                               vector(10.0, 5.0, -30.0), LOOKING_DOWN)
+        self.assertAlmostEqual(point[0], 10.0)
+        self.assertAlmostEqual(point[1], 5.0)
+        self.assertAlmostEqual(point[2], 0.0)
+    
+    def test_bottom_camera_image_top_maps_forward(self):
+        top = project_pixel_from_camera_pose(WIDTH / 2, 0, WIDTH, HEIGHT, 90.0,
+                                             vector(10.0, 5.0, -30.0), LOOKING_DOWN)
+        self.assertGreater(top[0], 10.0)
+        self.assertAlmostEqual(top[1], 5.0)
+    
+    def test_extrinsics_match_camera_pose(self):
+        from_extrinsics = project_pixel_to_ground(
+            WIDTH / 2, HEIGHT / 2, WIDTH, HEIGHT, CAMERA_CONFIGS['bottom_center'],
+            vector(10.0, 5.0, -30.0), IDENTITY
+        )
+        self.assertAlmostEqual(from_extrinsics[0], 10.0)
+        self.assertAlmostEqual(from_extrinsics[1], 5.0)
+    
+    def test_far_points_are_rejected(self):
+        # Just below the horizon: lands hundreds of metres ahead
+        self.assertIsNone(project_pixel_from_camera_pose(
+            WIDTH / 2, HEIGHT / 2 + 2, WIDTH, HEIGHT, 90.0, vector(0.0, 0.0, -30.0), IDENTITY
+        ))
+        # Above the horizon never hits the ground
+        self.assertIsNone(project_pixel_from_camera_pose(
+            WIDTH / 2, 0, WIDTH, HEIGHT, 90.0, vector(0.0, 0.0, -30.0), IDENTITY
+        ))
+
+
+class MultiCameraCaptureTest(unittest.TestCase):
+    """All cameras in one request and one inference pass"""
+    
+    def make_drone(self, cameras, client):
+        drone = SearchAndRescueDrone(cameras=cameras)
+        drone.rpc = ResilientRPC(lambda: client)
+        drone.rpc.connect()
+        drone.model = FakeModel()
+        self.addCleanup(drone.rpc.close)
+        return drone
+    
+    def test_one_request_and_one_inference_pass(self):
+        cameras = ('front_center', 'bottom_center', 'front_left')
+        client = FakeClient()
+        drone = self.make_drone(cameras, client)
+        analysis = drone.capture_and_analyze_frames()
+        
+        self.assertTrue(analysis['success'])
+        self.assertEqual(len(client.image_calls), 1)
+        self.assertEqual([r.camera_name for r in client.image_calls[0]], list(cameras))
+        self.assertEqual(len(drone.model.calls), 1)
+        self.assertEqual(len(drone.model.calls[0]), len(cameras))
+        
+        self.assertEqual(set(analysis['frames']), set(cameras))
+        bottom = analysis['frames']['bottom_center']['detections'][0]
+        self.assertEqual(bottom['camera'], 'bottom_center')
+        self.assertAlmostEqual(bottom['ground_position'][0], 0.0, delta=1.0)
+        self.assertAlmostEqual(bottom['ground_position'][1], 0.0, delta=1.0)
+    
+    def test_unknown_camera_is_mapped_from_response_pose(self):
+        drone = self.make_drone(('3',), FakeClient())
+        analysis = drone.capture_and_analyze_frames()
+        
+        ground_position = analysis['detections'][0]['ground_position']
+        self.assertIsNotNone(ground_position)
+        self.assertAlmostEqual(ground_position[0], 0.0, delta=1.0)
+    
+    def test_unmapped_detections_are_recorded_once_per_stop(self):
+        drone = self.make_drone(('front_center', 'bottom_center'), FakeClient())
+        
+        for _ in range(2):
+            analysis = drone.capture_and_analyze_frames()
+            hits = drone._record_visual_detections(analysis, 1, (0, 0, 30), "at stop 1", 5.0)
+        
+        self.assertEqual(len(hits), 1)
+        unmapped = [v for v in drone.victims_found if v['ground_position'] is None]
+        self.assertEqual(len(unmapped), 1)
+        self.assertEqual(unmapped[0]['camera'], 'front_center')
+        self.assertEqual(unmapped[0]['sightings'], 2)
+        self.assertEqual(len(drone.victims_found), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
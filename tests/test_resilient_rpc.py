@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Unit tests for ResilientRPC
+Run with: python -m unittest discover tests
+"""
+
+import os
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from search_and_rescue import CircuitOpenError, ResilientRPC, RPCUnavailableError
+
+
+class FakeClient:
+    """Stands in for an AirSim client"""
+    
+    def __init__(self, release):
+        self.release = release
+        self.closed = False
+    
+    def getMultirotorState(self):
+        return 'state'
+    
+    def simGetImages(self, requests):
+        # Hang until the test releases it
+        self.release.wait()
+        return []
+    
+    def simGetObjectPose(self, name):
+        raise ValueError(f"unknown object {name}")
+    
+    def simGetCollisionInfo(self):
+        raise ConnectionResetError("connection reset")
+    
+    def close(self):
+        self.closed = True
+
+
+class ResilientRPCTest(unittest.TestCase):
+    """Channel isolation, deadlines and circuit breaking"""
+    
+    def setUp(self):
+        self.release = threading.Event()
+        self.rpc = ResilientRPC(lambda: FakeClient(self.release),
+                                timeouts={'control': 1.0, 'imaging': 0.1, 'sensing': 0.1},
+                                deadlines={'imaging': 0.5, 'sensing': 0.5},
+                                backoff_base=0.01, backoff_cap=0.02)
+        self.rpc.connect()
+    
+    def tearDown(self):
+        self.release.set()
+        self.rpc.close()
+    
+    def test_hung_imaging_call_leaves_control_alone(self):
+        control_client = self.rpc.client
+        
+        with self.assertRaises(RPCUnavailableError):
+            self.rpc.call('simGetImages', [], category='imaging')
+        
+        self.assertEqual(self.rpc.call('getMultirotorState'), 'state')
+        self.assertIs(self.rpc.client, control_client)
+        stats = self.rpc.get_stats()
+        self.assertEqual(stats['channels']['control']['reconnects'], 0)
+        self.assertGreater(stats['channels']['imaging']['abandoned_workers'], 0)
+    
+    def test_overall_deadline_bounds_call(self):
+        started = time.time()
+        with self.assertRaises(RPCUnavailableError):
+            self.rpc.call('simGetImages', [], category='imaging')
+        self.assertLess(time.time() - started, 1.0)
+    
+    def test_failed_attempts_open_circuit(self):
+        with self.assertRaises(RPCUnavailableError):
+            self.rpc.call('simGetImages', [], category='imaging', deadline=5.0)
+        
+        self.assertEqual(self.rpc.get_stats()['circuits']['imaging'], 'open')
+        with self.assertRaises(CircuitOpenError):
+            self.rpc.call('simGetImages', [], category='imaging')
+    
+    def test_simulator_errors_are_not_retried(self):
+        with self.assertRaises(ValueError):
+            self.rpc.call('simGetObjectPose', 'Victim', category='sensing')
+        
+        counter = self.rpc.get_stats()['categories']['sensing']
+        self.assertEqual(counter['retries'], 0)
+        self.assertEqual(self.rpc.get_stats()['circuits']['sensing'], 'closed')
+    
+    def test_retired_client_is_closed(self):
+        client = self.rpc.client
+        worker = self.rpc.channels['control'].worker
+        
+        with self.assertRaises(RPCUnavailableError):
+            self.rpc.call('simGetCollisionInfo', retries=0)
+        
+        worker.thread.join(1.0)
+        self.assertTrue(client.closed)
+    
+    def test_control_reconnects_past_max_reconnects(self):
+        rpc = ResilientRPC(lambda: FakeClient(self.release), max_reconnects=1,
+                           backoff_base=0.01, backoff_cap=0.02)
+        rpc.connect()
+        self.addCleanup(rpc.close)
+        for _ in range(3):
+            with self.assertRaises(RPCUnavailableError):
+                rpc.call('simGetCollisionInfo', retries=0)
+        
+        self.assertEqual(rpc.call('getMultirotorState'), 'state')
+        self.assertEqual(rpc.get_stats()['channels']['control']['reconnects'], 3)
+    
+    def test_successful_call_restores_reconnect_allowance(self):
+        rpc = ResilientRPC(lambda: FakeClient(self.release), max_reconnects=1,
+                           backoff_base=0.01, backoff_cap=0.02)
+        rpc.connect()
+        self.addCleanup(rpc.close)
+        for _ in range(2):
+            with self.assertRaises(RPCUnavailableError):
+                rpc.call('simGetCollisionInfo', category='imaging', retries=0)
+            self.assertEqual(rpc.call('getMultirotorState', category='imaging'), 'state')
+        
+        self.assertEqual(rpc.get_stats()['channels']['imaging']['reconnects'], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Unit tests for ConfirmationRoutePlanner
+Run with: python -m unittest discover tests
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from search_and_rescue import ConfirmationRoutePlanner
+
+
+WAYPOINTS = [
+    (0, 0, -30),
+    (100, 0, -30),
+    (100, 100, -30),
+    (0, 100, -30),
+    (50, 50, -30),
+]
+BASE = (0, 0, -10)
+
+
+class ConfirmationRoutePlannerTest(unittest.TestCase):
+    """Candidate insertion and budget handling"""
+    
+    def make_planner(self, budget):
+        return ConfirmationRoutePlanner(WAYPOINTS, BASE, speed=10,
+                                        flight_time_budget=budget, confirm_altitude=15)
+    
+    def test_nearby_candidate_is_inserted(self):
+        planner = self.make_planner(600)
+        outcome = planner.add_candidate((60, 10, 0), BASE, 'visual')
+        
+        self.assertEqual(outcome, 'inserted')
+        kinds = [stop['kind'] for stop in planner.route]
+        self.assertEqual(kinds.count('confirmation'), 1)
+        self.assertEqual(kinds.count('coverage'), len(WAYPOINTS))
+        self.assertEqual(len(planner.pending_candidates()), 1)
+    
+    def test_close_candidates_are_merged(self):
+        planner = self.make_planner(600)
+        planner.add_candidate((60, 10, 0), BASE, 'visual')
+        outcome = planner.add_candidate((62, 11, 0), BASE, 'audio')
+        
+        self.assertEqual(outcome, 'merged')
+        self.assertEqual(len(planner.pending_candidates()), 1)
+        self.assertEqual(planner.pending_candidates()[0]['sources'], {'visual', 'audio'})
+    
+    def test_rejected_candidate_keeps_coverage_route(self):
+        # Regression: rejecting an unreachable candidate used to drop every
+        # coverage stop, ending the search
+        planner = self.make_planner(60)
+        route_before = [stop['position'] for stop in planner.route]
+        
+        outcome = planner.add_candidate((1000, 1000, 0), BASE, 'visual')
+        
+        self.assertEqual(outcome, 'rejected')
+        self.assertEqual([stop['position'] for stop in planner.route], route_before)
+        self.assertEqual(planner.dropped_coverage, 0)
+        self.assertEqual(planner.pending_candidates(), [])
+    
+    def test_candidate_displaces_coverage_when_budget_is_tight(self):
+        planner = self.make_planner(70)
+        self.assertTrue(planner.trim_to_budget(BASE))
+        dropped_before = planner.dropped_coverage
+        
+        outcome = planner.add_candidate((200, 0, 0), BASE, 'visual')
+        
+        self.assertEqual(outcome, 'inserted')
+        self.assertGreater(planner.dropped_coverage, dropped_before)
+        self.assertIn('confirmation', [stop['kind'] for stop in planner.route])
+        self.assertLessEqual(planner.route_time(BASE), planner.time_remaining())
+    
+    def test_resolve_updates_records(self):
+        planner = self.make_planner(600)
+        record = {'type': 'visual'}
+        planner.add_candidate((60, 10, 0), BASE, 'visual', record)
+        candidate = planner.pending_candidates()[0]
+        
+        planner.resolve(candidate, True)
+        
+        self.assertEqual(candidate['status'], 'confirmed')
+        self.assertTrue(record['confirmed'])
+        self.assertEqual(planner.pending_candidates(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the search mission loop
+Run with: python -m unittest discover tests
+"""
+
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from search_and_rescue import ResilientRPC, SearchAndRescueDrone
+
+
+def vector(x, y, z):
+    return SimpleNamespace(x_val=x, y_val=y, z_val=z)
+
+
+class FakeClient:
+    """Teleports to every move target; the victim is heard within 15 m"""
+    
+    def __init__(self, victim):
+        self.position = vector(0.0, 0.0, -10.0)
+        self.victim = victim
+    
+    def getMultirotorState(self):
+        kinematics = SimpleNamespace(
+            position=self.position,
+            orientation=SimpleNamespace(w_val=1.0, x_val=0.0, y_val=0.0, z_val=0.0),
+            linear_velocity=vector(0.0, 0.0, 0.0)
+        )
+        return SimpleNamespace(kinematics_estimated=kinematics)
+    
+    def moveToPositionAsync(self, x, y, z, speed):
+        self.position = vector(x, y, z)
+        return SimpleNamespace(join=lambda: None)
+    
+    def simGetImages(self, requests):
+        return []
+    
+    def simGetObjectPose(self, name):
+        return SimpleNamespace(position=self.victim)
+
+
+class SearchMissionTest(unittest.TestCase):
+    """Confirmation visits in the mission loop"""
+    
+    def make_drone(self, victim):
+        client = FakeClient(victim)
+        drone = SearchAndRescueDrone()
+        drone.rpc = ResilientRPC(lambda: client)
+        drone.rpc.connect()
+        drone.start_position = vector(0.0, 0.0, -10.0)
+        self.addCleanup(drone.rpc.close)
+        return drone
+    
+    def test_audio_confirmation_updates_existing_record(self):
+        drone = self.make_drone(vector(100.0, 0.0, 0.0))
+        
+        drone.search_mission(search_area_size=100, altitude=10, speed=10,
+                             flight_time_budget=600)
+        
+        audio = [v for v in drone.victims_found if v['type'] == 'audio']
+        self.assertEqual(len(audio), 1)
+        self.assertTrue(audio[0]['confirmed'])
+        self.assertEqual(audio[0]['hearings'], 2)
+        self.assertAlmostEqual(audio[0]['distance'], 5.0)
+    
+    def test_return_to_base_uses_search_speed(self):
+        drone = self.make_drone(vector(500.0, 500.0, 0.0))
+        moves = []
+        client = drone.rpc.client
+        original = client.moveToPositionAsync
+        client.moveToPositionAsync = lambda *args: moves.append(args) or original(*args)
+        
+        drone.search_mission(search_area_size=20, altitude=10, speed=4,
+                             flight_time_budget=600)
+        drone.return_to_base()
+        
+        self.assertEqual(moves[-1], (0.0, 0.0, -10.0, 4))
+
+
+if __name__ == '__main__':
+    unittest.main()